@@ -5,7 +5,7 @@ import numpy as np
 
 import functools
 import warnings
-from typing import List, Any
+from typing import Any, Dict, Hashable, Iterator, List, Tuple
 
 import pandas as pd
 from sliceable_dict import TypedSliceDict, SliceDict
@@ -13,6 +13,12 @@ from sliceable_dict import TypedSliceDict, SliceDict
 import fancy_collections.lib as lib
 from fancy_collections.formatting import Formatter
 
+_PANDAS_TYPES = (pd.Series, pd.DataFrame, pd.Index)
+
+# Exact classes of the usual values, which are instances of
+# `_PANDAS_TYPES`. See `DictOfPandas._validate_type`.
+_EXACT_PANDAS_TYPES = frozenset([pd.Series, pd.DataFrame, *lib.EXACT_INDEX_TYPES])
+
 
 class Axis:
     def __init__(self, name):
@@ -21,7 +27,9 @@ class Axis:
     def __get__(self, instance: DictOfPandas | None, owner) -> pd.Index:
         if instance is None:  # class attribute access
             return self  # noqa
-        return pd.Index(instance.keys())
+        # pandas converts a keys view to a list anyway, which is
+        # slower than listing the underlying dict directly
+        return pd.Index(list(instance.data))
 
     def __set__(self, instance: DictOfPandas, value: Any) -> None:
         value = pd.Index(value)
@@ -32,6 +40,19 @@ class Axis:
                 f"{self._name} has {len(instance.keys())} elements, "
                 f"but {len(value)} values was passed."
             )
+        if self._can_rename_directly(instance):
+            key_types = instance._key_types
+            if key_types:
+                try:
+                    for key in value:
+                        instance._validate_type(key, key_types, "key")
+                except Exception as e:
+                    msg = f"Cannot set new {self._name}, because {e}"
+                    raise type(e)(msg) from None
+            # The values are already validated, only the keys change.
+            instance.data = dict(zip(value, instance.data.values()))
+            return
+
         data: dict = instance.data
         try:
             instance.data = {}
@@ -45,36 +66,106 @@ class Axis:
         finally:
             instance.data = data
 
+    @staticmethod
+    def _can_rename_directly(instance: SliceDict) -> bool:
+        # A TypedSliceDict restricts keys only by `_key_types`, as long
+        # as it does not modify keys in `_cast`. (`__setitem_single__`
+        # is final there.)
+        return (
+            isinstance(instance, TypedSliceDict)
+            and type(instance)._cast is TypedSliceDict._cast
+        )
+
 
 class IndexMixin:
     def _get_indexes(self: SliceDict) -> List[pd.Index]:
-        indexes = []
-        for obj in self.values():
-            if isinstance(obj, pd.Index):
-                index = obj
-            else:
-                index = obj.index
-            indexes.append(index)
-        return indexes
+        # pd.Index has no `index` attribute, Series and DataFrames have
+        return [getattr(o, "index", o) for o in self.values()]
+
+    def _get_unique_indexes(self) -> List[pd.Index]:
+        # Many items often share the very same index object, so
+        # we drop identical objects before doing any set operation.
+        return list({id(i): i for i in self._get_indexes()}.values())
 
     def union_index(self) -> pd.Index:
-        indexes = self._get_indexes()
-        if indexes:
-            return functools.reduce(pd.Index.union, self._get_indexes())
-        return pd.Index([])
+        indexes = self._get_unique_indexes()
+        if len(indexes) == 1:
+            return indexes[0]
+        if not indexes:
+            return pd.Index([])
+        if not self._can_union_by_append(indexes):
+            return functools.reduce(pd.Index.union, indexes)
+
+        # pd.Index.union returns the other index unchanged (and unsorted),
+        # if one index is empty or both are equal, so we drop those
+        names = {i.name for i in indexes}
+        name = names.pop() if len(names) == 1 else None
+        nonempty = [i for i in indexes if not i.empty] or indexes
+        first = nonempty[0]
+        others = [i for i in nonempty[1:] if not i.equals(first)]
+        if not others:
+            return first.rename(name)
+
+        # concatenate once and hash once, instead of
+        # building a new index with every pairwise union
+        return first.append(others).unique().rename(name).sort_values()
+
+    @staticmethod
+    def _can_union_by_append(indexes: List[pd.Index]) -> bool:
+        # Index subclasses (e.g. RangeIndex, DatetimeIndex) keep some
+        # attributes (e.g. the type itself, freq or tz) in a union, which
+        # append would lose. Object indices with mixed types are sorted
+        # specially by a union. Duplicates are kept by a union, but not
+        # by unique().
+        dtype = indexes[0].dtype
+        return (
+            isinstance(dtype, np.dtype)
+            and dtype.kind in "iufb"
+            and all(
+                type(i) is pd.Index and i.dtype == dtype and i.is_unique
+                for i in indexes
+            )
+        )
 
     def shared_index(self) -> pd.Index:
-        indexes = self._get_indexes()
-        if indexes:
+        indexes = self._get_unique_indexes()
+        if len(indexes) == 1:
+            return indexes[0]
+        if not indexes:
+            return pd.Index([])
+        if not self._can_intersect_shortest_first(indexes):
             return functools.reduce(pd.Index.intersection, indexes)
-        return pd.Index([])
+        # start with the shortest index, which keeps the
+        # intermediate results as small as possible
+        first = indexes[0]
+        indexes = sorted(indexes, key=len)
+        index = indexes[0]
+        for other in indexes[1:]:
+            index = index.intersection(other)
+        if first.is_monotonic_increasing and index.is_monotonic_increasing:
+            return index
+        # restore the order of the first index, like
+        # pd.Index.intersection would have returned it
+        ordered = first[first.isin(index)]
+        if not ordered.is_unique:
+            ordered = ordered.unique()
+        return ordered.set_names(index.names)
+
+    @staticmethod
+    def _can_intersect_shortest_first(indexes: List[pd.Index]) -> bool:
+        # The type and dtype of an intersection depend on the order of
+        # the operands (e.g. RangeIndex(10) and Index([1, 2]) result in
+        # a RangeIndex, but not the other way round). Plain indices of
+        # the same dtype always result in a plain index of that dtype.
+        dtype = indexes[0].dtype
+        return all(type(i) is pd.Index and i.dtype == dtype for i in indexes)
 
 
 class DictOfPandas(TypedSliceDict, IndexMixin):
     # allow any keys, but restrict
     # values to pandas objects
     _key_types = ()
-    _value_types = (pd.Series, pd.DataFrame, pd.Index)
+    _value_types = _PANDAS_TYPES
 
     # .columns property
     columns = Axis("columns")
@@ -83,6 +174,33 @@ class DictOfPandas(TypedSliceDict, IndexMixin):
     def _constructor(self) -> type[DictOfPandas]:
         return type(self)
 
+    @classmethod
+    def _from_validated(cls, mapping: dict) -> DictOfPandas:
+        """
+        Create a new instance without checking keys and values.
+
+        All keys and values of `mapping` must already satisfy the
+        type restrictions of `cls`.
+        """
+        obj = cls.__new__(cls)
+        obj.data = dict(mapping)
+        return obj
+
+    def _accepts_flat_items(self) -> bool:
+        # Items of flatten() are (str or tuple) keys and pandas objects,
+        # which the type checks only reject if a subclass restricts them.
+        # A custom __init__ would be skipped by _from_validated().
+        return (
+            not self._key_types
+            and self._value_types is _PANDAS_TYPES
+            and type(self)._cast is TypedSliceDict._cast
+            and type(self).__init__ is DictOfPandas.__init__
+        )
+
+    def copy(self) -> DictOfPandas:
+        # UserDict.copy() would set and validate every item again
+        return self.__copy__()
+
     @property
     def empty(self) -> bool:
         """
@@ -127,14 +245,29 @@ class DictOfPandas(TypedSliceDict, IndexMixin):
         """
         return len(self) == 0 or all(o.empty for o in self.values())
 
-    def _uniquify_name(self, name: str) -> str:
-        if name not in self.keys():
-            return name
-        i = 1
-        self.union_index()
-        while f"{name}({i})" in self.keys():
+    @staticmethod
+    def _validate_type(
+        obj: object, types: type | tuple[type, ...], name: str, errors: str = "raise"
+    ) -> bool:
+        # A set lookup of the exact type is cheaper than isinstance,
+        # which would walk the class hierarchy of every value.
+        if types is _PANDAS_TYPES and type(obj) in _EXACT_PANDAS_TYPES:
+            return True
+        return TypedSliceDict._validate_type(obj, types, name, errors)
+
+    def _uniquify_name(self, name: str, taken: Dict[str, int]) -> str:
+        # `name` is already in use. `taken` holds all names generated
+        # so far, mapped to the next suffix to try, so that repeated
+        # collisions of the same name do not need to re-check all the
+        # suffixes used before.
+        i = taken.get(name, 1)
+        new = f"{name}({i})"
+        while new in self.data or new in taken:
             i += 1
-        return f"{name}({i})"
+            new = f"{name}({i})"
+        taken[name] = i + 1
+        taken[new] = 1
+        return new
 
     def flatten(
         self, promote_index: bool = False, multiindex: bool = False
@@ -158,6 +291,11 @@ class DictOfPandas(TypedSliceDict, IndexMixin):
         -------
         DictOfPandas
 
+        Raises
+        ------
+        ValueError
+            If `multiindex` is True and a DataFrame item has duplicate column names.
+
         Examples
         --------
         >>> from fancy_collections import DictOfPandas
@@ -181,19 +319,39 @@ class DictOfPandas(TypedSliceDict, IndexMixin):
              0  1      |      0  2      |
              1  1      |      1  2      |
         """
-        data = dict()
+        data = dict(self._iter_flat(promote_index, multiindex))
+        if self._accepts_flat_items():
+            return self._from_validated(data)
+        return self.__class__(data)
+
+    def _iter_flat(
+        self, promote_index: bool, multiindex: bool
+    ) -> Iterator[Tuple[Hashable, pd.Series | pd.Index]]:
+        """Yield the (key, value) pairs of ``flatten()``."""
+        taken = dict()
         for key, value in self.items():
             if isinstance(value, pd.DataFrame):
-                for col, ser in dict(value).items():
+                if multiindex and not value.columns.is_unique:
+                    # the (key, column) tuples would silently overwrite
+                    # each other and drop data
+                    raise ValueError(
+                        f"Cannot flatten item {key!r} with multiindex=True, "
+                        f"because its columns have duplicates."
+                    )
+                for col, ser in value.items():
                     if multiindex:
-                        data[(key, col)] = ser
+                        yield (key, col), ser
+                        continue
+                    name = f"{key}_{col}"
+                    if name in self.data or name in taken:
+                        name = self._uniquify_name(name, taken)
                     else:
-                        data[self._uniquify_name(f"{key}_{col}")] = ser
+                        taken[name] = 1
+                    yield name, ser
             elif promote_index and isinstance(value, pd.Index):
-                data[key] = value.to_series()
+                yield key, value.to_series()
             else:
-                data[key] = value
-        return self.__class__(data)
+                yield key, value
 
     def to_dataframe(self, how="outer") -> pd.DataFrame:
         """
@@ -246,6 +404,12 @@ class DictOfPandas(TypedSliceDict, IndexMixin):
         -------
         frame: pandas.DataFrame
 
+        Notes
+        -----
+        The values of each column of the resulting frame are stored
+        contiguously in memory, so column-wise operations (e.g. ``sum``,
+        ``mean`` or ``groupby``) on the result are fast.
+
         See Also
         --------
         DictOfPandas.flatten:  Make series from DataFrame items in a DictOfPandas
@@ -284,17 +448,29 @@ class DictOfPandas(TypedSliceDict, IndexMixin):
         """
         if how not in ["inner", "outer"]:
             raise ValueError("`how` must be one of 'inner' or 'outer'")
-        flat = dict(self.flatten(promote_index=True, multiindex=multiindex))
+        # build the columns directly, without the detour over
+        # a flattened DictOfPandas and its value type checks
+        flat = dict(self._iter_flat(promote_index=True, multiindex=multiindex))
+        if not flat:
+            return pd.DataFrame()
+        index = next(iter(flat.values())).index
+        if all(v.index is index for v in flat.values()):
+            # nothing to align, so concat only needs to copy the columns
+            return pd.concat(flat, axis=1)
         if how == "outer":
             target_index = self.union_index()
         else:  # how == "inner"
             target_index = self.shared_index()
-        df = pd.DataFrame(
+        # fillna() would also overwrite NaNs that are already present
+        # in the data, so we need to reindex every column on its own
+        return pd.DataFrame(
             {k: v.reindex(target_index, fill_value=fill_value) for k, v in flat.items()}
         )
-        return df
 
     def __repr__(self) -> str:
+        # The rendered string is intentionally not cached. Items are
+        # mutable pandas objects, that can change in place without the
+        # DictOfPandas noticing, so a cached repr could show stale data.
         max_rows = pd.get_option("display.max_rows")
         min_rows = pd.get_option("display.min_rows")
         return self.to_string(max_rows=max_rows, min_rows=min_rows)
@@ -333,13 +509,11 @@ class DictOfPandas(TypedSliceDict, IndexMixin):
             return True
         if not isinstance(other, (dict, SliceDict)):
             return False
-        if self.keys() != other.keys():
+        other_data = getattr(other, "data", other)
+        if self.data is other_data:
+            return True
+        if self.data.keys() != other_data.keys():
             return False
-        # equivalent code:
-        # for key in self.keys():
-        #     if not _pandasObjEqual(self[key], other[key]):
-        #         return False
-        # return True
-        values = zip(self.values(), other.values())
         eq = lib.pd_obj_equals_other
-        return next(filter(lambda e: not eq(*e), values), True) is True
+        # compare by key, the order of keys might differ
+        return all(eq(v, other_data[k]) for k, v in self.data.items())
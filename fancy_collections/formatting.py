@@ -1,16 +1,27 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
+import itertools
 import shutil
 from typing import Tuple, List, Iterable, Any
 
+import numpy as np
 import pandas as pd
 
+import fancy_collections.lib as lib
+
 
 class Formatter:
     column_seperator = " | "
     header_seperator = "="
 
+    # We store method names, so overwritten methods in subclasses are used
+    _stringify_methods = {
+        pd.Series: "_stringify_Series",
+        pd.DataFrame: "_stringify_DataFrame",
+        **dict.fromkeys(lib.EXACT_INDEX_TYPES, "_stringify_Index"),
+    }
+
     def __init__(
         self,
         obj,
@@ -59,37 +70,49 @@ class Formatter:
             key = self.key_to_string(key, val)
             lines = self.stringify(val).splitlines()
             objects[key] = lines
-            widths[key] = self._get_maxlen(lines + [key])
-
-        keys = tuple(widths.keys())
-        front_keys, back_keys = set(), set()
-        line_length = 0
-        for fkey, bkey in zip(keys, keys[::-1]):
-            line_length += widths[fkey] + len(self.column_seperator)
-            if line_length < display_width:
-                front_keys.add(fkey)
-            line_length += widths[bkey] + len(self.column_seperator)
-            if line_length < display_width:
-                back_keys.add(bkey)
-
-        if not front_keys:
-            # ensure that we have at least on column
-            front_keys.add(keys[0])
-
-        for k, v in objects.items():
-            if k in front_keys:
-                self._add(k, v)
-
-        if len(front_keys) + len(back_keys) < len(keys):
+            widths[key] = max(self._get_maxlen(lines), len(key))
+
+        keys = list(objects)
+        n_front, n_back = self._count_fitting_columns(
+            [widths[k] for k in keys], display_width
+        )
+        # ensure that we have at least on column
+        n_front = max(n_front, 1)
+
+        for k in keys[:n_front]:
+            self._add(k, objects[k], widths[k])
+
+        if n_front + n_back < len(keys):
             self._add("...", ["..."])
 
-        for k, v in objects.items():
-            if k in back_keys and k not in front_keys:
-                self._add(k, objects[k])
+        # front and back columns overlap, if all columns fit
+        for k in keys[max(n_front, len(keys) - n_back) :]:
+            self._add(k, objects[k], widths[k])
 
         return self._render()
 
+    def _count_fitting_columns(
+        self, widths: List[int], display_width: int
+    ) -> Tuple[int, int]:
+        """
+        Count the columns that fit the display from the front and from the back.
+
+        Columns are taken alternately from the front and from the back,
+        until the line is longer than `display_width`.
+        """
+        w = np.asarray(widths, dtype=np.int64) + len(self.column_seperator)
+        alternating = np.empty(2 * len(w), dtype=np.int64)
+        alternating[0::2] = w
+        alternating[1::2] = w[::-1]
+        fits = np.cumsum(alternating) < display_width
+        return int(fits[0::2].sum()), int(fits[1::2].sum())
+
     def stringify(self, obj: Any) -> str:
+        # fast lookup of the exact type, the isinstance
+        # checks below are needed for subclasses only
+        name = self._stringify_methods.get(type(obj))
+        if name is not None:
+            return getattr(self, name)(obj)
         if isinstance(obj, pd.Index):
             return self._stringify_Index(obj)
         if isinstance(obj, pd.Series):
@@ -109,6 +132,8 @@ class Formatter:
                 f" rows:    {r}\n"
                 f" columns: {c}\n"
             )
+        # With `max_rows` set, pandas truncates the frame before
+        # formatting it, so hidden rows are never stringified.
         return df.to_string(
             **self._trunc_options,
             header=self.show_df_column_names,
@@ -122,7 +147,8 @@ class Formatter:
                 f"{self._stringify_empty_class(s)}\n"  # prevent black formatting
                 f" rows: {len(s)}\n"
             )
-        # We use to_frame because it uses less space between index and values
+        # We use to_frame because it uses less space between index and values.
+        # The frame shares the data with the series, nothing is copied.
         # return s.to_string(**self._trunc_options, header=False)
         return s.to_frame(name=" ").to_string(
             **self._trunc_options,
@@ -134,54 +160,68 @@ class Formatter:
     def _stringify_Index(self, idx: pd.Index) -> str:
         if idx.empty:
             return f"{self._stringify_empty_class(idx)}"
-        idx = pd.Series("", index=idx, dtype=str)
-        return idx.to_string(**self._trunc_options, header=False)
+        max_rows = self._trunc_options["max_rows"]
+        min_rows = self._trunc_options["min_rows"] or 0
+        n = max(max_rows or 0, min_rows)
+        if max_rows and len(idx) > 2 * n and getattr(idx, "freq", None) is None:
+            # Only the first and last rows are shown, so we drop the
+            # middle before building the series used for formatting.
+            # The rest is still truncated like the full index would be.
+            # (A `freq` would get lost, so we keep such indices whole.)
+            idx = idx.delete(slice(n, len(idx) - n))
+        ser = pd.Series("", index=idx, dtype=str)
+        return ser.to_string(**self._trunc_options, header=False)
 
     def _render(self) -> str:
-        string = self.__make_header()
-        string += self.__make_seperator_row()
+        rows = [self.__make_header(), self.__make_seperator_row()]
         while True:
             row = self.__make_body_row()
             if row is None:
                 break
-            string += row
-        return string
+            rows.append(row)
+        return "".join(rows)
 
     def __make_header(self) -> str:
-        line = ""
-        for key, _, n in self.__to_render:
-            line += key.rjust(n) + self.column_seperator
-        return line + "\n"
+        parts = []
+        for key, _, n, _ in self.__to_render:
+            parts.append(key.rjust(n))
+        return self.__join_row(parts)
 
     def __make_seperator_row(self) -> str:
-        line = ""
-        for _, _, n in self.__to_render:
-            line += self.header_seperator * n + self.column_seperator
-        return line + "\n"
+        return self.__join_row([rule for _, _, _, rule in self.__to_render])
 
     def __make_body_row(self) -> str | None:
-        line = ""
+        to_render = self.__to_render
+        parts = []
         count = 0
-        for _, gen, _ in self.__to_render:
+        for _, gen, _, _ in to_render:
             empty, s = next(gen)  # see Formatter.__iter4ever()
-            line += s + self.column_seperator
+            parts.append(s)
             count += empty
-        if count == len(self.__to_render):
+        if count == len(to_render):
             # all generators are exhausted
             return None
-        return line + "\n"
+        return self.__join_row(parts)
+
+    def __join_row(self, parts: List[str]) -> str:
+        sep = self.column_seperator
+        return sep.join(parts) + sep + "\n"
 
-    def _add(self, key: str, lines: List[str]) -> None:
-        n = self._get_maxlen(lines + [key])
+    def _add(self, key: str, lines: List[str], width: int | None = None) -> None:
+        n = width
+        if n is None:
+            n = max(self._get_maxlen(lines), len(key))
         gen = self.__iter4ever(lines, n)
-        self.__to_render.append((key, gen, n))
+        rule = self.header_seperator * n
+        self.__to_render.append((key, gen, n, rule))
 
     @staticmethod
     def __iter4ever(lines: List[str], n: int) -> Tuple[bool, str]:
         for line in lines:
             yield False, line.center(n)
+        blank = True, " " * n
         while True:
-            yield True, " " * n
+            yield blank
 
     @staticmethod
     def _stringify_empty_class(obj) -> str:
@@ -189,7 +229,7 @@ class Formatter:
 
     @staticmethod
     def _get_maxlen(obj: Iterable) -> int:
-        return max(map(len, obj))
+        return max(map(len, obj), default=0)
 
     @staticmethod
     def _justify(
@@ -225,7 +265,6 @@ class Formatter:
         if width is None:
             width = Formatter._get_maxlen(lines)
         just = str.ljust if site == "left" else str.rjust
-        lines = [just(s, width) for s in lines]  # noqa
         if isinstance(str_or_lines, str):
-            return "\n".join(lines)
-        return lines
+            return "\n".join(map(just, lines, itertools.repeat(width)))
+        return [just(s, width) for s in lines]  # noqa
@@ -6,6 +6,21 @@ import logging
 
 import pandas as pd
 
+_logger = logging.getLogger()
+
+# The exact classes of the usual pd.Index objects, which are
+# looked up by type() instead of checked with isinstance().
+EXACT_INDEX_TYPES = (
+    pd.Index,
+    pd.RangeIndex,
+    pd.DatetimeIndex,
+    pd.TimedeltaIndex,
+    pd.PeriodIndex,
+    pd.CategoricalIndex,
+    pd.IntervalIndex,
+    pd.MultiIndex,
+)
+
 
 def log_call(level="DEBUG"):
     level = level if isinstance(level, int) else logging.getLevelName(level)
@@ -16,7 +31,9 @@ def log_call(level="DEBUG"):
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logging.log(level, f"{func.__name__} was called")
+            # skip building the record, if nobody would see it
+            if _logger.isEnabledFor(level):
+                _logger.log(level, "%s was called", func.__name__)
             return func(*args, **kwargs)
 
         return wrapper
@@ -26,22 +43,23 @@ def log_call(level="DEBUG"):
 
 def index_equals_other(this: pd.Index, other: pd.Index):
     assert isinstance(this, pd.Index)
-    return isinstance(other, pd.Index) and this.equals(other)
+    return (
+        isinstance(other, pd.Index) and len(this) == len(other) and this.equals(other)
+    )
 
 
 def series_equals_other(this: pd.Series, other: pd.Series):
     assert isinstance(this, pd.Series)
-    return (
-        isinstance(other, pd.Series)
-        and this.index.equals(other.index)
-        and this.equals(other)
-    )
+    if not isinstance(other, pd.Series) or len(this) != len(other):
+        return False
+    return this.index.equals(other.index) and this.equals(other)
 
 
 def dataframe_equals_other(this: pd.DataFrame, other: pd.DataFrame):
     assert isinstance(this, pd.DataFrame)
     return (
         isinstance(other, pd.DataFrame)
+        and this.shape == other.shape
         and this.columns.equals(other.columns)
         and this.index.equals(other.index)
         and this.equals(other)
@@ -61,6 +79,34 @@ def pd_obj_equals_other(
     raise TypeError(f"{type(this)} is not a pandas object")
 
 
+_FREQ_INDEX_TYPES = (pd.DatetimeIndex, pd.TimedeltaIndex, pd.PeriodIndex)
+
+
+def _get_axis_attributes(obj) -> tuple[bool, bool, bool]:
+    """
+    Whether `obj` has the attributes `freq`, `index` and `columns`.
+
+    For pandas objects the answer is known by the type, which spares us
+    the `hasattr` calls. Those are expensive for missing attributes on
+    Series and DataFrames, because they go through ``NDFrame.__getattr__``.
+    """
+    if isinstance(obj, pd.DataFrame):
+        return False, True, True
+    if isinstance(obj, pd.Series):
+        return False, True, False
+    if isinstance(obj, pd.Index):
+        return isinstance(obj, _FREQ_INDEX_TYPES), False, False
+    return hasattr(obj, "freq"), hasattr(obj, "index"), hasattr(obj, "columns")
+
+
+def _freqs_equal(this, other) -> bool:
+    # also equal, if both have no `freq` attribute
+    this_has_freq = hasattr(this, "freq")
+    if this_has_freq != hasattr(other, "freq"):
+        return False
+    return not this_has_freq or this.freq == other.freq
+
+
 def other_equals_this(
     this,
     other,
@@ -73,7 +119,7 @@ def other_equals_this(
     check_columns_dtype=False,  # obj.columns.dtype
     check_names=False,  # index.name or series.name
     check_freq=None,  # obj.index.freq or index.freq, also equal if both are missing
-):
+) -> bool:
     """
     Check if right equals left.
 
@@ -114,14 +160,16 @@ def other_equals_this(
     Returns
     -------
     bool
+        True if ``other`` equals ``this`` in all checked aspects.
     """
-    if check_freq is None and hasattr(this, "freq"):
+    has_freq, has_index, has_columns = _get_axis_attributes(this)
+    if check_freq is None and has_freq:
         check_freq = True
         if check_index is None:
             check_index = False
-    if check_index is None and hasattr(this, "index"):
+    if check_index is None and has_index:
         check_index = True
-    if check_columns is None and hasattr(this, "columns"):
+    if check_columns is None and has_columns:
         check_columns = True
 
     def eq(a, b, name):
@@ -146,29 +194,45 @@ def other_equals_this(
     if check_type and not isinstance(other, type(this)):
         return False
 
-    if check_values and not eq(this, other, None):
+    def axes_eq():
+        if check_index:  # pd.Series, pd.DataDframe
+            if not eq(this, other, "index"):
+                return False
+            if check_index_dtype:
+                if not eq(this.index, other.index, "dtype"):
+                    return False
+            if check_freq and not _freqs_equal(this.index, other.index):
+                return False
+        elif check_freq:  # pd.Index
+            if not _freqs_equal(this, other):
+                return False
+
+        if check_columns:
+            if not eq(this, other, "columns"):
+                return False
+            if check_columns_dtype:
+                if not eq(this.columns, other.columns, "dtype"):
+                    return False
+        return True
+
+    # Checks that may raise on a missing attribute run after the
+    # values, so unequal values still return False, instead of raising.
+    axes_first = (not check_index or has_index) and (not check_columns or has_columns)
+    if axes_first and not axes_eq():
         return False
 
-    if check_index:  # pd.Series, pd.DataDframe
-        if not eq(this, other, "index"):
+    # The values are checked after the cheap checks, because
+    # comparing them is the most expensive of all checks.
+    if check_values:
+        if isinstance(this, (pd.Series, pd.DataFrame, pd.Index)) and (
+            this.shape != getattr(other, "shape", None)
+        ):
             return False
-        if check_index_dtype:
-            if not eq(this.index, other.index, "dtype"):
-                return False
-        if check_freq:
-            freqs = hasattr(this.index, "freq") + hasattr(other.index, "freq")
-            if freqs == 1 or freqs == 2 and not eq(this.index, other.index, "freq"):
-                return False
-    elif check_freq:  # pd.Index
-        if not eq(this, other, "freq"):
+        if not eq(this, other, None):
             return False
 
-    if check_columns:
-        if not eq(this, other, "columns"):
-            return False
-        if check_columns_dtype:
-            if not eq(this.columns, other.columns, "dtype"):
-                return False
+    if not axes_first and not axes_eq():
+        return False
 
     if check_dtypes:
         for name in ["dtypes", "dtype"]:
@@ -183,3 +247,5 @@ def other_equals_this(
 
     if check_names and not eq(this, other, "names"):
         return False
+
+    return True
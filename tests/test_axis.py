@@ -2,7 +2,7 @@
 import numpy as np
 import pytest
 import pandas as pd
-from fancy_collections.core import Axis
+from fancy_collections.core import Axis, DictOfPandas
 from sliceable_dict import SliceDict
 
 T, F = True, False
@@ -120,3 +120,43 @@ def test_set_index_fails_and_keep_old_keys():
     with pytest.raises(TypeError):
         rc.columns = ["x", "y", 9999]
     assert rc.keys() == dict.fromkeys(["a", "b", "c"]).keys()
+
+
+@pytest.mark.parametrize(
+    "setter_name,args,expected",
+    [
+        ("__setitem__", ("b", pd.Index([1])), pd.Index(["a", "b"])),
+        ("__setitem__", (["b", "c"], [pd.Index([1])] * 2), pd.Index(["a", "b", "c"])),
+        ("__delitem__", ("a",), pd.Index([])),
+        ("__ior__", ({"b": pd.Index([1])},), pd.Index(["a", "b"])),
+        ("setdefault", ("b", pd.Index([1])), pd.Index(["a", "b"])),
+        ("pop", ("a",), pd.Index([])),
+        ("popitem", (), pd.Index([])),
+        ("update", ({"b": pd.Index([1])},), pd.Index(["a", "b"])),
+        ("clear", (), pd.Index([])),
+    ],
+)
+def test_columns_are_updated(setter_name, args, expected):
+    inst = DictOfPandas(a=pd.Index([1]))
+    inst.columns.name = "cols"
+    assert inst.columns.name is None
+    getattr(inst, setter_name)(*args)
+    assert inst.columns.equals(expected)
+    inst.data = {"x": pd.Index([1])}
+    assert inst.columns.equals(pd.Index(["x"]))
+    inst.data["z"] = pd.Index([1])
+    assert inst.columns.equals(pd.Index(["x", "z"]))
+
+
+def test_set_columns_on_typed_dict():
+    class StrKeys(DictOfPandas):
+        _key_types = (str,)
+
+    inst = StrKeys(a=pd.Index([1]), b=pd.Index([2]))
+    values = list(inst.values())
+    inst.columns = ["x", "y"]
+    assert inst.keys() == dict.fromkeys(["x", "y"]).keys()
+    assert all(a is b for a, b in zip(inst.values(), values))
+    with pytest.raises(TypeError):
+        inst.columns = ["z", 9999]
+    assert inst.keys() == dict.fromkeys(["x", "y"]).keys()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+import numpy as np
+import pandas as pd
+import pytest
+from fancy_collections import DictOfPandas
+from fancy_collections.formatting import Formatter
+
+
+@pytest.fixture(autouse=True)
+def terminal_width(monkeypatch):
+    monkeypatch.setenv("COLUMNS", "80")
+
+
+@pytest.fixture
+def mixed():
+    return DictOfPandas(
+        a=pd.Series([1.5, 2.25, np.nan], index=[0, 1, 10]),
+        bbbbbbbbbb=pd.DataFrame({"x": [1, 2], "y": ["u", "vvvvvv"]}),
+        c=pd.Index([1, 2]),
+        d=pd.Series(dtype=float),
+        e=pd.DataFrame(),
+        f=pd.Index([]),
+    )
+
+
+def test_to_string(mixed):
+    expected = (
+        "       a |   bbbbbbbbbb |     c | ... |               e |           f | \n"
+        "======== | ============ | ===== | === | =============== | =========== | \n"
+        "0   1.50 |    x       y | 1     | ... | Empty DataFrame | Empty Index | \n"
+        "1   2.25 | 0  1       u | 2     |     |  rows:    0     |             | \n"
+        "10   NaN | 1  2  vvvvvv |       |     |  columns: 0     |             | \n"
+    )
+    assert mixed.to_string() == expected
+
+
+def test_to_string_truncated(mixed):
+    expected = (
+        "      a |   bbbbbbbbbb |     c | ... |               e |           f | \n"
+        "======= | ============ | ===== | === | =============== | =========== | \n"
+        "0   1.5 | 0  1       u | 1     | ... | Empty DataFrame | Empty Index | \n"
+        "..  ... | 1  2  vvvvvv | 2     |     |  rows:    0     |             | \n"
+        "10  NaN |              |       |     |  columns: 0     |             | \n"
+    )
+    result = mixed.to_string(max_rows=2, min_rows=2, show_df_column_names=False)
+    assert result == expected
+
+
+def test_to_string_wide():
+    di = DictOfPandas({f"col{i}": pd.Series(range(i)) for i in range(1, 30)})
+    expected = (
+        "col1 | col2 | col3 | col4 |  col5 | ... |  col26 |  col27 |  col28 |  col29 | \n"
+        "==== | ==== | ==== | ==== | ===== | === | ====== | ====== | ====== | ====== | \n"
+        "0  0 | 0  0 | 0  0 | 0  0 | 0   0 | ... | 0    0 | 0    0 | 0    0 | 0    0 | \n"
+        "     | 1  1 | 1  1 | 1  1 | .. .. |     | ..  .. | ..  .. | ..  .. | ..  .. | \n"
+        "     |      | 2  2 | 2  2 | 4   4 |     | 25  25 | 26  26 | 27  27 | 28  28 | \n"
+        "     |      |      | 3  3 |       |     |        |        |        |        | \n"
+    )
+    assert di.to_string(max_rows=4, min_rows=2) == expected
+
+
+def test_to_string_long():
+    di = DictOfPandas(
+        a=pd.Series(range(100)),
+        b=pd.Index(range(50)),
+        c=pd.DataFrame({"x": range(100)}),
+    )
+    expected = (
+        "     a |       b |      c | \n"
+        "====== | ======= | ====== | \n"
+        "0    0 | 0       |      x | \n"
+        "1    1 | 1       | 0    0 | \n"
+        "..  .. |      .. | 1    1 | \n"
+        "98  98 | 48      | ..  .. | \n"
+        "99  99 | 49      | 98  98 | \n"
+        "       |         | 99  99 | \n"
+    )
+    assert di.to_string(max_rows=6, min_rows=4) == expected
+
+
+def test_to_string_empty():
+    assert DictOfPandas().to_string() == "Empty DictOfPandas"
+
+
+@pytest.mark.parametrize(
+    "columns,expected", [("80", "    a |     b |     c | "), ("10", "    a | ... | ")]
+)
+def test_to_string_keeps_columns_that_fit(monkeypatch, columns, expected):
+    monkeypatch.setenv("COLUMNS", columns)
+    di = DictOfPandas(a=pd.Index([1]), b=pd.Index([2]), c=pd.Index([3]))
+    assert di.to_string().splitlines()[0] == expected
+
+
+def test_stringify_subclasses():
+    class MySeries(pd.Series):
+        pass
+
+    class MyFormatter(Formatter):
+        def _stringify_Series(self, s):
+            return "my series"
+
+    formatter = MyFormatter({})
+    assert formatter.stringify(pd.Series([1])) == "my series"
+    assert formatter.stringify(MySeries([1])) == "my series"
+    assert formatter.stringify(pd.RangeIndex(2)) == Formatter({}).stringify(
+        pd.Index([0, 1])
+    )
+    assert formatter.stringify(1) == "1"
+
+
+def test_stringify_long_object_index():
+    idx = pd.Index([1, None, 3] * 15, dtype=object)
+    result = Formatter({}, max_rows=5).stringify(idx)
+    assert result == "1        \nNone     \n       ..\nNone     \n3        "
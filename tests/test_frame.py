@@ -1,10 +1,12 @@
 #!/usr/bin/env python
+import numpy as np
 import pandas as pd
 import pytest
 from fancy_collections import DictOfPandas, SliceDict, TypedSliceDict
 from typing import KeysView  # do not import from collection, fails for py3.10
 
 T, F = True, False
+N = np.nan
 
 
 @pytest.fixture(params=[DictOfPandas, TypedSliceDict, SliceDict])
@@ -37,3 +39,295 @@ def test__getitem__(klass, indexer, expected_keys):
     instance = klass(a=pd.Series([0.0]), b=pd.Series([1.0]))
     result = instance[indexer]
     assert result.keys() == KeysView(expected_keys)
+
+
+@pytest.mark.parametrize(
+    "how,expected",
+    [
+        (
+            "outer",
+            pd.DataFrame(
+                dict(a=[11, 11, N, N, N], b=[22, 22, 22, N, N], c=[N, 33, N, 33, 33]),
+                index=[0, 1, 2, 4, 7],
+            ),
+        ),
+        ("inner", pd.DataFrame(dict(a=[11], b=[22], c=[33]), index=[1])),
+    ],
+)
+def test_to_pandas(how, expected):
+    di = DictOfPandas(
+        a=pd.Series(11, index=range(2)),
+        b=pd.Series(22, index=range(3)),
+        c=pd.Series(33, index=range(1, 9, 3)),
+    )
+    result = di.to_pandas(how=how)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_to_pandas_fill_value():
+    # already present NaNs must not be filled
+    di = DictOfPandas(a=pd.Series([1.0, np.nan]), b=pd.Series([2.0], index=[2]))
+    result = di.to_pandas(fill_value=-1)
+    expected = pd.DataFrame(dict(a=[1.0, np.nan, -1], b=[-1, -1, 2.0]))
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("method", ["union_index", "shared_index"])
+def test_index_methods_with_shared_index(method):
+    idx = pd.date_range("2000", periods=5)
+    di = DictOfPandas(a=pd.Series(1, index=idx), b=pd.Series(2, index=idx), c=idx)
+    assert getattr(di, method)() is idx
+
+
+@pytest.mark.parametrize(
+    "method,expected", [("union_index", [0, 1, 2, 3]), ("shared_index", [1, 2])]
+)
+def test_index_methods(method, expected):
+    di = DictOfPandas(
+        a=pd.Series(1, index=[0, 1, 2]),
+        b=pd.Series(2, index=[1, 2, 3]),
+        c=pd.Index([1, 2]),
+    )
+    assert getattr(di, method)().equals(pd.Index(expected))
+    assert getattr(DictOfPandas(), method)().empty
+
+
+def test_flatten_uniquifies_names():
+    di = DictOfPandas(
+        a=pd.DataFrame({"b_c": [1], "x": [2]}),
+        a_b=pd.DataFrame({"c": [3]}),
+        a_x=pd.Series([4]),
+    )
+    result = di.flatten()
+    assert list(result.keys()) == ["a_b_c", "a_x(1)", "a_b_c(1)", "a_x"]
+
+
+def test_flatten_duplicate_columns():
+    di = DictOfPandas(a=pd.DataFrame([[1, 2]], columns=["x", "x"]))
+    result = di.flatten()
+    assert list(result.keys()) == ["a_x", "a_x(1)"]
+    assert [v.tolist() for v in result.values()] == [[1], [2]]
+    with pytest.raises(ValueError):
+        di.flatten(multiindex=True)
+    with pytest.raises(ValueError):
+        di.to_pandas(multiindex=True)
+
+
+def test_eq():
+    a, b = pd.Series([1.0, 2.0]), pd.Index([1, 2])
+    di = DictOfPandas(a=a, b=b)
+    assert di == di
+    assert di == DictOfPandas(a=a.copy(), b=b.copy())
+    assert di == DictOfPandas(b=b, a=a)
+    assert di == dict(a=a, b=b)
+    assert di != DictOfPandas(a=a)
+    assert di != DictOfPandas(a=b, b=a)
+    assert di != dict(a=a, b=pd.Index([1, 3]))
+    assert di != [a, b]
+
+
+def test_union_index_sorted_and_with_duplicates():
+    di = DictOfPandas(a=pd.Index([3, 1]), b=pd.Index([2, 1]))
+    assert di.union_index().equals(pd.Index([1, 2, 3]))
+    di = DictOfPandas(a=pd.Index([1, 1, 2]), b=pd.Index([2, 3]))
+    assert di.union_index().equals(pd.Index([1, 1, 2, 3]))
+
+
+def test_shared_index_with_empty_index():
+    di = DictOfPandas(a=pd.Index([1, 2]), b=pd.Index([], dtype=int), c=pd.Index([2]))
+    assert di.shared_index().empty
+
+
+@pytest.mark.parametrize("fill_value", [np.nan, -1])
+def test_to_pandas_columns_are_contiguous(fill_value):
+    di = DictOfPandas(
+        a=pd.Series(np.arange(5.0)),
+        b=pd.DataFrame({"x": np.arange(7.0), "y": np.arange(7.0)}),
+    )
+    result = di.to_pandas(fill_value=fill_value)
+    for col in result.columns:
+        assert result[col].to_numpy().flags.c_contiguous
+
+
+def test_flatten_does_not_compute_indexes(monkeypatch):
+    def fail(self):
+        raise AssertionError("indexes should not be computed")
+
+    monkeypatch.setattr(DictOfPandas, "_get_indexes", fail)
+    di = DictOfPandas(a=pd.DataFrame({"x": [1]}), a_x=pd.Series([2]))
+    assert list(di.flatten().keys()) == ["a_x(1)", "a_x"]
+
+
+@pytest.mark.parametrize(
+    "value", [pd.Series(dtype=float), pd.DataFrame(), pd.Index([]), pd.RangeIndex(2)]
+)
+def test_value_types(value):
+    class OnlySeries(DictOfPandas):
+        _value_types = (pd.Series,)
+
+    DictOfPandas(a=value)
+    if isinstance(value, pd.Series):
+        OnlySeries(a=value)
+    else:
+        with pytest.raises(TypeError):
+            OnlySeries(a=value)
+    with pytest.raises(TypeError):
+        DictOfPandas(a=value.to_numpy())
+
+
+def test_copy():
+    di = DictOfPandas(a=pd.Series([1]))
+    result = di.copy()
+    assert type(result) is DictOfPandas
+    assert result == di
+    assert result.data is not di.data
+    result["b"] = pd.Series([2])
+    assert list(di.columns) == ["a"]
+    assert list(result.columns) == ["a", "b"]
+
+
+def test_flatten_result_is_validated_for_restricted_subclasses():
+    class OnlyFrames(DictOfPandas):
+        _value_types = (pd.DataFrame,)
+
+    assert type(DictOfPandas(a=pd.DataFrame({"x": [1]})).flatten()) is DictOfPandas
+    with pytest.raises(TypeError):
+        OnlyFrames(a=pd.DataFrame({"x": [1]})).flatten()
+
+
+def test_empty_indexes_are_not_shared():
+    DictOfPandas().union_index().name = "oops"
+    DictOfPandas().columns.name = "oops"
+    assert DictOfPandas().union_index().name is None
+    assert DictOfPandas().shared_index().name is None
+    assert DictOfPandas().columns.name is None
+
+
+@pytest.mark.parametrize("how", ["outer", "inner"])
+def test_to_pandas_keeps_row_order_of_shared_index(how):
+    di = DictOfPandas(a=pd.DataFrame({"x": [1, 2]}, index=["b", "a"]))
+    result = di.to_pandas(how=how)
+    assert result.index.equals(pd.Index(["b", "a"]))
+    assert result["a_x"].tolist() == [1, 2]
+
+
+def test_to_pandas_mixed_timezones():
+    naive = pd.date_range("2000", periods=2)
+    aware = pd.date_range("2000", periods=2, tz="UTC")
+    di = DictOfPandas(
+        a=pd.Series([1, 2], index=naive), b=pd.Series([3, 4], index=aware)
+    )
+    result = di.to_pandas()
+    assert result.index.equals(naive.union(aware))
+    assert result["a"].dropna().tolist() == [1, 2]
+    assert result["b"].dropna().tolist() == [3, 4]
+
+
+@pytest.mark.parametrize(
+    "indexes",
+    [
+        [pd.date_range("2000", periods=3), pd.date_range("2000-01-03", periods=3)],
+        [
+            pd.date_range("2000", periods=3, tz="Europe/Berlin"),
+            pd.date_range("2000", periods=3, tz="US/Eastern"),
+        ],
+        [pd.RangeIndex(3), pd.RangeIndex(2, 6)],
+        [pd.Index(["b", "a"]), pd.Index(["b", "a"])],
+        [pd.Index([3, 1]), pd.Index([3, 1])],
+        [pd.Index([3, 1], name="x"), pd.Index([2], name="x"), pd.Index([], dtype=int)],
+    ],
+)
+def test_union_index_like_pandas(indexes):
+    di = DictOfPandas({str(i): idx for i, idx in enumerate(indexes)})
+    expected = indexes[0]
+    for idx in indexes[1:]:
+        expected = expected.union(idx)
+    result = di.union_index()
+    assert type(result) is type(expected)
+    assert result.equals(expected)
+    assert result.dtype == expected.dtype
+    assert result.name == expected.name
+    assert getattr(result, "freq", None) == getattr(expected, "freq", None)
+
+
+def test_to_pandas_keeps_freq():
+    di = DictOfPandas(
+        a=pd.Series(1, index=pd.date_range("2000", periods=3)),
+        b=pd.Series(2, index=pd.date_range("2000-01-03", periods=3)),
+    )
+    assert di.to_pandas().index.freq == "D"
+    assert di.to_pandas(fill_value=0).index.freq == "D"
+
+
+@pytest.mark.parametrize("start,periods", [("2000-01-03", 1), ("2000-01-02", 2)])
+def test_to_pandas_values_with_freq(start, periods):
+    b = pd.Series(np.arange(5.0), index=pd.date_range("2000-01-01", periods=5))
+    di = DictOfPandas(
+        a=pd.Series(1.0, index=pd.date_range(start, periods=periods)), b=b
+    )
+    result = di.to_pandas()
+    pd.testing.assert_series_equal(result["b"], b, check_names=False)
+    assert result["a"].count() == periods
+
+
+def test_to_pandas_duplicate_labels():
+    di = DictOfPandas(
+        a=pd.Series([1, 2, 3], index=[1, 1, 2]), b=pd.Series([5, 6], index=[1, 2])
+    )
+    expected = pd.DataFrame(dict(a=[1, 2, 3], b=[5, 5, 6]), index=[1, 1, 2])
+    pd.testing.assert_frame_equal(di.to_pandas(), expected)
+
+
+def test_to_pandas_shared_index_with_duplicate_labels():
+    idx = pd.Index([1, 1, 2])
+    di = DictOfPandas(
+        a=pd.Series([1, 2, 3], index=idx), b=pd.Series([4, 5, 6], index=idx)
+    )
+    expected = pd.DataFrame(dict(a=[1, 2, 3], b=[4, 5, 6]), index=idx)
+    pd.testing.assert_frame_equal(di.to_pandas(), expected)
+    pd.testing.assert_frame_equal(di.to_pandas(how="inner"), expected)
+
+
+def test_flatten_calls_init_of_subclasses():
+    class Meta(DictOfPandas):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.meta = "meta"
+
+    result = Meta(a=pd.DataFrame({"x": [1]})).flatten()
+    assert type(result) is Meta
+    assert result.meta == "meta"
+    assert list(result.keys()) == ["a_x"]
+
+
+def test_shared_index_keeps_order_of_first_index():
+    di = DictOfPandas(a=pd.Index([3, 2, 1, 0]), b=pd.Index([1, 3]))
+    assert di.shared_index().equals(pd.Index([3, 1]))
+
+
+def test_shared_index_of_multiindexes():
+    mi = pd.MultiIndex.from_tuples([(2, "b"), (1, "a"), (3, "c")], names=["n", "s"])
+    di = DictOfPandas(
+        a=pd.Series([1, 2, 3], index=mi), b=pd.Series([4, 5], index=mi[:2])
+    )
+    expected = mi[:2]
+    pd.testing.assert_index_equal(di.shared_index(), expected)
+    result = di.to_pandas(how="inner")
+    pd.testing.assert_index_equal(result.index, expected)
+    assert result["a"].tolist() == [1, 2]
+    assert result["b"].tolist() == [4, 5]
+
+
+def test_shared_index_keeps_type_and_dtype():
+    di = DictOfPandas(a=pd.RangeIndex(10), b=pd.Index([1, 2]))
+    pd.testing.assert_index_equal(di.shared_index(), pd.RangeIndex(1, 3), exact=True)
+    di = DictOfPandas(a=pd.Index([2, 1], dtype="int32"), b=pd.Index([1, 2, 3]))
+    expected = pd.Index([2, 1], dtype="int32").intersection(pd.Index([1, 2, 3]))
+    pd.testing.assert_index_equal(di.shared_index(), expected, exact=True)
+
+
+def test_index_methods_keep_duplicates_of_one_index():
+    idx = pd.Index([1, 1, 2])
+    di = DictOfPandas(a=pd.Series(0, index=idx), b=pd.Series(1, index=idx))
+    assert di.shared_index() is idx
+    assert di.union_index() is idx
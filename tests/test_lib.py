@@ -1 +1,130 @@
 #!/usr/bin/env python
+import numpy as np
+import pandas as pd
+import pytest
+
+from fancy_collections import lib
+
+N = np.nan
+
+
+@pytest.mark.parametrize(
+    "this,other,expected",
+    [
+        (pd.Series([1.0, N]), pd.Series([1.0, N]), True),
+        (pd.Series([1.0, N]), pd.Series([1.0, 2.0]), False),
+        (pd.Series([1, 2]), pd.Series([1, 2]), True),
+        (pd.Series([1, 2]), pd.Series([1.0, 2.0]), False),
+        (pd.Series([1, 2]), pd.Series([1, 2], dtype="Int64"), False),
+        (pd.Series([1, 2]), pd.Series([1, 2], index=[1, 2]), False),
+        (pd.Series(["a", "b"]), pd.Series(["a", "b"]), True),
+        (pd.Series([1, 2]), pd.Index([1, 2]), False),
+    ],
+)
+@pytest.mark.parametrize("shared_index", [True, False])
+def test_series_equals_other(this, other, expected, shared_index):
+    if shared_index and isinstance(other, pd.Series) and this.index.equals(other.index):
+        other = pd.Series(other.to_numpy(), index=this.index, dtype=other.dtype)
+        assert other.index is this.index
+    assert lib.series_equals_other(this, other) is expected
+
+
+@pytest.mark.parametrize("level", ["DEBUG", "INFO"])
+def test_log_call(caplog, level):
+    @lib.log_call(level)
+    def func(x, y=1):
+        return x + y
+
+    with caplog.at_level("INFO"):
+        assert func(1, y=2) == 3
+    expected = ["func was called"] if level == "INFO" else []
+    assert caplog.messages == expected
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        pd.Index([1]),
+        pd.RangeIndex(1),
+        pd.MultiIndex.from_tuples([(1, 2)]),
+        pd.DatetimeIndex([]),
+        pd.TimedeltaIndex([]),
+        pd.PeriodIndex([], freq="D"),
+        pd.Series([1]),
+        pd.DataFrame(),
+        np.array([1]),
+        None,
+    ],
+)
+def test_get_axis_attributes(obj):
+    expected = tuple(hasattr(obj, name) for name in ["freq", "index", "columns"])
+    assert lib._get_axis_attributes(obj) == expected
+
+
+@pytest.mark.parametrize(
+    "this,other,expected",
+    [
+        (pd.DataFrame({"a": [1.0, N]}), pd.DataFrame({"a": [1.0, N]}), True),
+        (pd.DataFrame({"a": [1.0, N]}), pd.DataFrame({"a": [1.0, 2.0]}), False),
+        (pd.DataFrame({"a": [1], "b": [2]}), pd.DataFrame({"a": [1], "b": [2]}), True),
+        (pd.DataFrame({"a": [1], "b": [2]}), pd.DataFrame({"a": [1], "b": [3]}), False),
+        (pd.DataFrame({"a": [1], "b": [2]}), pd.DataFrame({"a": [1], "c": [2]}), False),
+        (
+            pd.DataFrame({"a": [1], "b": [2]}),
+            pd.DataFrame({"a": [1], "b": [2.0]}),
+            False,
+        ),
+        (pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [1]}, index=[1]), False),
+        (
+            pd.DataFrame({"a": [1], "b": ["x"]}),
+            pd.DataFrame({"a": [1], "b": ["x"]}),
+            True,
+        ),
+        (pd.DataFrame(), pd.DataFrame(), True),
+        (pd.DataFrame({"a": [1]}), pd.Series([1], name="a"), False),
+    ],
+)
+def test_dataframe_equals_other(this, other, expected):
+    assert lib.dataframe_equals_other(this, other) is expected
+
+
+dti = pd.date_range("2000", periods=3)
+
+
+@pytest.mark.parametrize(
+    "this,other,kwargs,expected",
+    [
+        (pd.Series([1, 2]), pd.Series([1, 2]), {}, True),
+        (pd.Series([1, 2]), pd.Series([1, 3]), {}, False),
+        (pd.Series([1, 2]), pd.Series([1, 2], index=[1, 2]), {}, False),
+        (pd.Index([1], name="x"), pd.Index([1]), dict(check_names=True), False),
+        (pd.Series([1, 2]), pd.Series([1, 2.0]), dict(check_dtypes=True), False),
+        (pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [1]}), {}, True),
+        (pd.DataFrame({"a": [1]}), pd.DataFrame({"b": [1]}), {}, False),
+        (pd.DataFrame({"a": [1]}), pd.Series([1]), {}, False),
+        (dti, dti.copy(), {}, True),
+        (dti, pd.DatetimeIndex(list(dti)), {}, False),
+        (pd.Index([1]), pd.Index([1]), dict(check_freq=True), True),
+        (1, 1, {}, True),
+        (1, 2, {}, False),
+        # unequal values win over checks on missing attributes
+        (pd.Series([1]), pd.Series([2]), dict(check_names=True), False),
+        (1, 2, dict(check_dtypes=True), False),
+        (1, 2, dict(check_index=True), False),
+    ],
+)
+def test_other_equals_this(this, other, kwargs, expected):
+    assert lib.other_equals_this(this, other, **kwargs) is expected
+
+
+@pytest.mark.parametrize(
+    "this,other,kwargs",
+    [
+        (pd.Series([1]), pd.Series([1]), dict(check_names=True)),
+        (float("1.5"), float("1.5"), dict(check_dtypes=True)),
+        (float("1.5"), float("1.5"), dict(check_index=True)),
+    ],
+)
+def test_other_equals_this_raises_on_missing_attribute(this, other, kwargs):
+    with pytest.raises(AttributeError):
+        lib.other_equals_this(this, other, **kwargs)
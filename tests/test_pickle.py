@@ -24,3 +24,10 @@ def test_pickling(klass, kwargs):
     for k in inst.keys():
         assert result[k].equals(inst[k])
         assert result[k].index.equals(inst[k].index)
+
+
+def test_pickled_state_holds_only_data():
+    inst = DictOfPandas(a=pd.Series(range(3)))
+    inst.columns  # noqa
+    assert set(vars(inst)) == {"data"}
+    assert set(vars(pickle.loads(pickle.dumps(inst)))) == {"data"}